@@ -0,0 +1,40 @@
+"""Read-through cache for hot barcode lookups.
+
+Scans follow a heavy-tailed distribution: a handful of popular products
+account for the bulk of traffic. Caching the fully serialized scan
+payload per barcode turns the hot path into a dict hit — no DB round
+trip, no ORM hydration, no validation or JSON encoding.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import Barcode, FoodItem, ScanResult
+
+
+def get_food_by_barcode(code: str) -> Optional[FoodItem]:
+    """Uncached database lookup of the food item behind a barcode."""
+    with get_session() as session:
+        barcode = session.exec(select(Barcode).where(Barcode.code == code)).unique().one_or_none()
+        return barcode.food_item if barcode is not None else None
+
+
+@lru_cache(maxsize=10_000)
+def scan_payload_for_barcode(code: str) -> Optional[bytes]:
+    """orjson-serialized ScanResult bytes for a barcode, or None if unknown.
+
+    The bytes can be written straight into an HTTP response. Misses (None)
+    are cached too, so repeated scans of unknown codes stay cheap.
+    """
+    food_item = get_food_by_barcode(code)
+    if food_item is None:
+        return None
+    return ScanResult.from_food_item(food_item, code).to_orjson()
+
+
+def invalidate_scan_cache() -> None:
+    """Drop all cached payloads. Call after any FoodItem or Barcode write."""
+    scan_payload_for_barcode.cache_clear()
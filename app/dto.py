@@ -0,0 +1,72 @@
+"""msgspec-based DTOs for hot scan endpoints.
+
+msgspec generates a specialized C encoder per struct and benchmarks
+well ahead of Pydantic model_dump + orjson, so endpoints where encode
+cost dominates can respond with these instead of the Pydantic schemas:
+
+    return Response(encode(ScanResultFast.from_food_item(fi, code)), media_type="application/json")
+
+Request validation stays on the Pydantic schemas in app.models.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import msgspec
+
+from app.models import FoodItem
+
+ENCODER = msgspec.json.Encoder()
+
+
+def encode(dto: msgspec.Struct) -> bytes:
+    """Serialize a DTO to JSON bytes with the shared encoder."""
+    return ENCODER.encode(dto)
+
+
+class NutritionSummaryFast(msgspec.Struct, frozen=True):
+    """msgspec twin of app.models.NutritionSummary"""
+
+    energy_kcal: Optional[float] = None
+    fat: Optional[float] = None
+    saturated_fat: Optional[float] = None
+    carbohydrates: Optional[float] = None
+    sugars: Optional[float] = None
+    fiber: Optional[float] = None
+    protein: Optional[float] = None
+    salt: Optional[float] = None
+
+    @classmethod
+    def from_food_item(cls, food_item: FoodItem) -> "NutritionSummaryFast":
+        return cls(
+            energy_kcal=food_item.energy_kcal,
+            fat=food_item.fat,
+            saturated_fat=food_item.saturated_fat,
+            carbohydrates=food_item.carbohydrates,
+            sugars=food_item.sugars,
+            fiber=food_item.fiber,
+            protein=food_item.protein,
+            salt=food_item.salt,
+        )
+
+
+class ScanResultFast(msgspec.Struct, frozen=True):
+    """msgspec twin of app.models.ScanResult"""
+
+    barcode: str
+    found: bool
+    food_item: Optional[Dict[str, Any]] = None
+    nutri_score: Optional[int] = None
+    health_assessment: Optional[str] = None
+    scan_timestamp: Optional[datetime] = None
+
+    @classmethod
+    def from_food_item(cls, food_item: FoodItem, barcode: str, found: bool = True) -> "ScanResultFast":
+        return cls(
+            barcode=barcode,
+            found=found,
+            food_item=food_item.model_dump(exclude={"barcodes", "scan_history", "response_cache_json"}),
+            nutri_score=None if food_item.nutri_score is None else int(food_item.nutri_score),
+            health_assessment=None if food_item.health_assessment is None else food_item.health_assessment.value,
+            scan_timestamp=datetime.now(timezone.utc),
+        )
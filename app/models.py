@@ -1,17 +1,57 @@
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
-from datetime import datetime
+from pydantic import ConfigDict, computed_field
+from sqlalchemy import DateTime, Index, LargeBinary, Numeric, SmallInteger, Text, TypeDecorator, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.mutable import MutableList
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
-from decimal import Decimal
 from enum import Enum
 
+# Native text[] on PostgreSQL (ANY/overlap element operators, GIN-indexable,
+# no per-row JSON parsing); plain JSON on SQLite so tests keep working.
+# MutableList tracks in-place list mutations without disabling SQLAlchemy's
+# compiled-statement cache (ARRAY/JSON are cache_ok; any custom TypeDecorator
+# added here later must also set cache_ok = True).
+StringList = MutableList.as_mutable(ARRAY(Text()).with_variant(JSON(), "sqlite"))
+
+
+def nutrient_column() -> Column:
+    """Fixed-precision NUMERIC(6, 2) column returned as plain float (no per-row Decimal construction)."""
+    return Column(Numeric(6, 2, asdecimal=False))
+
+
+def created_at_column(index: bool = False) -> Column:
+    """Creation timestamp assigned by the database, so bulk inserts skip per-row Python datetimes."""
+    return Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=index)
+
+
+def updated_at_column() -> Column:
+    """Update timestamp: DB default on insert, func.now() emitted in every UPDATE statement.
+
+    onupdate (not server_onupdate, which only marks an existing trigger)
+    makes SQLAlchemy include now() in the UPDATE itself.
+    """
+    return Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
 
 # Enums for structured data
-class NutriScore(str, Enum):
-    A = "A"
-    B = "B"
-    C = "C"
-    D = "D"
-    E = "E"
+class NutriScore(int, Enum):
+    """Nutri-score rating, persisted as SMALLINT (1=A best … 5=E worst).
+
+    The integer form lets ORDER BY / range filters ("score B or better")
+    and aggregates use a plain B-tree index; `label` gives the letter.
+    """
+
+    A = 1
+    B = 2
+    C = 3
+    D = 4
+    E = 5
+
+    @property
+    def label(self) -> str:
+        """The public letter form, e.g. 'A'."""
+        return self.name
 
 
 class HealthAssessment(str, Enum):
@@ -20,78 +60,207 @@ class HealthAssessment(str, Enum):
     NOT_RECOMMENDED = "Not recommended"
 
 
-# Persistent models (stored in database)
-class FoodItem(SQLModel, table=True):
-    """Food item with nutritional information and Nutri-score"""
+class BarcodeType(int, Enum):
+    """Barcode symbology, stored as a SMALLINT instead of a free-form string"""
 
-    __tablename__ = "food_items"  # type: ignore[assignment]
+    EAN13 = 1
+    EAN8 = 2
+    UPC_A = 3
+    UPC_E = 4
+    ITF = 5
+    CODE128 = 6
+
+    @classmethod
+    def from_str(cls, name: str) -> "BarcodeType":
+        """Parse an API string like 'EAN13' or 'UPC-A' into a member."""
+        return cls[name.replace("-", "_").upper()]
+
+    def to_str(self) -> str:
+        """Render as the API string, e.g. 'UPC-A'."""
+        return self.name.replace("_", "-")
+
+
+class NutriScoreInt(TypeDecorator):
+    """SMALLINT column type that loads rows back as NutriScore members."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else NutriScore(value)
+
+
+class BarcodeTypeInt(TypeDecorator):
+    """SMALLINT column type that loads rows back as BarcodeType members."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else BarcodeType(value)
+
+
+# Value→member maps cached at import: a plain dict hit instead of
+# Enum.__call__ when rebuilding enums from DB values per response.
+_NUTRI_MAP: Dict[str, NutriScore] = {member.name: member for member in NutriScore}
+_HEALTH_MAP: Dict[str, HealthAssessment] = dict(HealthAssessment._value2member_map_)  # type: ignore[arg-type]
+
+
+def nutri_from_str(value: str) -> NutriScore:
+    """Look up a NutriScore member from its letter form ('A'–'E')."""
+    return _NUTRI_MAP[value]
+
+
+def health_from_str(value: str) -> HealthAssessment:
+    """Look up a HealthAssessment member from its stored string value."""
+    return _HEALTH_MAP[value]
+
+
+class _FoodItemNutritionBase(SQLModel):
+    """Fields shared by FoodItem and its create/update schemas.
+
+    Declared once so Pydantic compiles a single validator schema for the
+    shared fields instead of three.
+    """
 
-    id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=255, description="Food product name")
     brand: Optional[str] = Field(default=None, max_length=255, description="Brand name")
     description: Optional[str] = Field(default=None, max_length=1000, description="Product description")
 
-    # Nutritional information (per 100g)
-    energy_kj: Optional[Decimal] = Field(default=None, description="Energy in kJ per 100g")
-    energy_kcal: Optional[Decimal] = Field(default=None, description="Energy in kcal per 100g")
-    fat: Optional[Decimal] = Field(default=None, description="Fat content in grams per 100g")
-    saturated_fat: Optional[Decimal] = Field(default=None, description="Saturated fat in grams per 100g")
-    carbohydrates: Optional[Decimal] = Field(default=None, description="Carbohydrates in grams per 100g")
-    sugars: Optional[Decimal] = Field(default=None, description="Sugars in grams per 100g")
-    fiber: Optional[Decimal] = Field(default=None, description="Fiber in grams per 100g")
-    protein: Optional[Decimal] = Field(default=None, description="Protein in grams per 100g")
-    salt: Optional[Decimal] = Field(default=None, description="Salt in grams per 100g")
-    sodium: Optional[Decimal] = Field(default=None, description="Sodium in grams per 100g")
+    # Nutritional information (per 100g); floats in Python, fixed-precision Numeric(6, 2) in SQL
+    energy_kj: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Energy in kJ per 100g")
+    energy_kcal: Optional[float] = Field(
+        default=None, sa_column=nutrient_column(), description="Energy in kcal per 100g"
+    )
+    fat: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Fat content in grams per 100g")
+    saturated_fat: Optional[float] = Field(
+        default=None, sa_column=nutrient_column(), description="Saturated fat in grams per 100g"
+    )
+    carbohydrates: Optional[float] = Field(
+        default=None, sa_column=nutrient_column(), description="Carbohydrates in grams per 100g"
+    )
+    sugars: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Sugars in grams per 100g")
+    fiber: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Fiber in grams per 100g")
+    protein: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Protein in grams per 100g")
+    sodium: Optional[float] = Field(default=None, sa_column=nutrient_column(), description="Sodium in grams per 100g")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def salt(self) -> Optional[float]:
+        """Salt equivalent in grams per 100g (sodium × 2.5); only sodium is stored."""
+        return None if self.sodium is None else self.sodium * 2.5
 
     # Nutri-score and health assessment
-    nutri_score: Optional[NutriScore] = Field(default=None, description="Nutri-score rating A-E")
+    nutri_score: Optional[NutriScore] = Field(
+        default=None, sa_column=Column(NutriScoreInt, index=True), description="Nutri-score rating A-E"
+    )
     health_assessment: Optional[HealthAssessment] = Field(default=None, description="Health impact assessment")
 
     # Additional metadata
-    ingredients: Optional[List[str]] = Field(default=None, sa_column=Column(JSON), description="List of ingredients")
-    allergens: Optional[List[str]] = Field(default=None, sa_column=Column(JSON), description="List of allergens")
-    categories: Optional[List[str]] = Field(default=None, sa_column=Column(JSON), description="Product categories")
+    ingredients: Optional[List[str]] = Field(
+        default=None, sa_column=Column(StringList), description="List of ingredients"
+    )
+    allergens: Optional[List[str]] = Field(default=None, sa_column=Column(StringList), description="List of allergens")
+    categories: Optional[List[str]] = Field(
+        default=None, sa_column=Column(StringList), description="Product categories"
+    )
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    # Relationships
-    barcodes: List["Barcode"] = Relationship(back_populates="food_item")
+# Persistent models (stored in database)
+class FoodItem(_FoodItemNutritionBase, table=True):
+    """Food item with nutritional information and Nutri-score"""
+
+    __tablename__ = "food_items"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_fooditem_allergens_gin", "allergens", postgresql_using="gin"),
+        Index("ix_fooditem_categories_gin", "categories", postgresql_using="gin"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # Pre-serialized API payload, recomputed on every write (see refresh_response_cache);
+    # the scan endpoint can stream these bytes straight into the HTTP response
+    response_cache_json: Optional[bytes] = Field(
+        default=None, sa_column=Column(LargeBinary), description="orjson-serialized product payload"
+    )
+
+    # Timestamps (assigned by the database)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=updated_at_column())
+
+    # Relationships. barcodes is small and almost always wanted, so selectin
+    # batches it into one IN query. scan_history is unbounded (append-only),
+    # so it stays lazy — views that need it apply selectinload() per query.
+    barcodes: List["Barcode"] = Relationship(back_populates="food_item", sa_relationship_kwargs={"lazy": "selectin"})
     scan_history: List["ScanHistory"] = Relationship(back_populates="food_item")
 
+    def refresh_response_cache(self) -> None:
+        """Recompute the pre-serialized payload.
+
+        Call only after the row has been flushed and refreshed: id and
+        the timestamps are DB-assigned, so caching earlier would bake
+        nulls into the payload permanently.
+        """
+        if self.id is None:
+            raise ValueError("refresh_response_cache() requires a flushed row (id is still None)")
+        from app.serialization import orjson_dumps
+
+        self.response_cache_json = orjson_dumps(self.model_dump(exclude={"response_cache_json"}))
+
 
 class Barcode(SQLModel, table=True):
     """Barcode associated with food items"""
 
     __tablename__ = "barcodes"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_barcodes_type_code", "barcode_type", "code"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, max_length=50, description="Barcode value (EAN-13, UPC, etc.)")
-    barcode_type: str = Field(max_length=20, description="Type of barcode (EAN13, UPC, etc.)")
-    food_item_id: int = Field(foreign_key="food_items.id")
+    barcode_type: BarcodeType = Field(
+        sa_column=Column(BarcodeTypeInt, nullable=False, index=True), description="Type of barcode (EAN13, UPC, etc.)"
+    )
+    food_item_id: int = Field(foreign_key="food_items.id", index=True)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Timestamps (assigned by the database)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
 
-    # Relationships
-    food_item: FoodItem = Relationship(back_populates="barcodes")
+    # Relationships (joined: scan lookups almost always need the parent item)
+    food_item: FoodItem = Relationship(back_populates="barcodes", sa_relationship_kwargs={"lazy": "joined"})
 
 
 class ScanHistory(SQLModel, table=True):
     """History of barcode scans for analytics"""
 
     __tablename__ = "scan_history"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_scan_history_food_time", "food_item_id", "scan_timestamp"),
+        Index("ix_scan_history_time_score", "scan_timestamp", "nutri_score_at_scan"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    food_item_id: int = Field(foreign_key="food_items.id")
-    barcode_scanned: str = Field(max_length=50, description="The actual barcode that was scanned")
-    scan_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    food_item_id: int = Field(foreign_key="food_items.id", index=True)
+    barcode_scanned: str = Field(max_length=50, index=True, description="The actual barcode that was scanned")
+    scan_timestamp: Optional[datetime] = Field(default=None, sa_column=created_at_column(index=True))
     user_agent: Optional[str] = Field(default=None, max_length=500, description="Browser/device info")
     ip_address: Optional[str] = Field(default=None, max_length=45, description="User IP address")
 
-    # Relationships
-    food_item: FoodItem = Relationship(back_populates="scan_history")
+    # Denormalized from FoodItem at insert time so analytics queries
+    # (e.g. score distribution per week) stay on this table without a join
+    nutri_score_at_scan: Optional[NutriScore] = Field(
+        default=None, sa_column=Column(NutriScoreInt, index=True), description="Nutri-score of the item when scanned"
+    )
+    health_assessment_at_scan: Optional[HealthAssessment] = Field(
+        default=None, index=True, description="Health assessment of the item when scanned"
+    )
+
+    # Relationships (joined: scan lookups almost always need the parent item)
+    food_item: FoodItem = Relationship(back_populates="scan_history", sa_relationship_kwargs={"lazy": "joined"})
 
 
 class NutritionProfile(SQLModel, table=True):
@@ -104,111 +273,161 @@ class NutritionProfile(SQLModel, table=True):
     description: Optional[str] = Field(default=None, max_length=500)
 
     # Threshold values for health assessment
-    max_fat_per_100g: Optional[Decimal] = Field(default=None, description="Maximum recommended fat per 100g")
-    max_saturated_fat_per_100g: Optional[Decimal] = Field(default=None)
-    max_sugars_per_100g: Optional[Decimal] = Field(default=None)
-    max_salt_per_100g: Optional[Decimal] = Field(default=None)
-    min_fiber_per_100g: Optional[Decimal] = Field(default=None)
-    min_protein_per_100g: Optional[Decimal] = Field(default=None)
+    max_fat_per_100g: Optional[float] = Field(
+        default=None, sa_column=nutrient_column(), description="Maximum recommended fat per 100g"
+    )
+    max_saturated_fat_per_100g: Optional[float] = Field(default=None, sa_column=nutrient_column())
+    max_sugars_per_100g: Optional[float] = Field(default=None, sa_column=nutrient_column())
+    max_sodium_per_100g: Optional[float] = Field(
+        default=None, sa_column=nutrient_column(), description="Maximum recommended sodium per 100g (salt / 2.5)"
+    )
+    min_fiber_per_100g: Optional[float] = Field(default=None, sa_column=nutrient_column())
+    min_protein_per_100g: Optional[float] = Field(default=None, sa_column=nutrient_column())
+
+    # Timestamps (assigned by the database)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=updated_at_column())
 
-    # Nutri-score thresholds
-    nutri_score_thresholds: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
-
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Relationships
+    nutri_score_thresholds: List["NutriScoreThreshold"] = Relationship(
+        back_populates="profile", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
-# Non-persistent schemas (for validation, forms, API requests/responses)
-class FoodItemCreate(SQLModel, table=False):
-    """Schema for creating a new food item"""
+class NutriScoreThreshold(SQLModel, table=True):
+    """Per-profile Nutri-score thresholds, one row per (score, nutrient).
 
-    name: str = Field(max_length=255)
-    brand: Optional[str] = Field(default=None, max_length=255)
-    description: Optional[str] = Field(default=None, max_length=1000)
-
-    # Nutritional information
-    energy_kj: Optional[Decimal] = Field(default=None)
-    energy_kcal: Optional[Decimal] = Field(default=None)
-    fat: Optional[Decimal] = Field(default=None)
-    saturated_fat: Optional[Decimal] = Field(default=None)
-    carbohydrates: Optional[Decimal] = Field(default=None)
-    sugars: Optional[Decimal] = Field(default=None)
-    fiber: Optional[Decimal] = Field(default=None)
-    protein: Optional[Decimal] = Field(default=None)
-    salt: Optional[Decimal] = Field(default=None)
-    sodium: Optional[Decimal] = Field(default=None)
+    Replaces the former opaque JSON blob on NutritionProfile so thresholds
+    are typed, queryable in SQL, and cheap to load into the in-process
+    cache (see app.thresholds).
+    """
 
-    nutri_score: Optional[NutriScore] = Field(default=None)
-    health_assessment: Optional[HealthAssessment] = Field(default=None)
+    __tablename__ = "nutri_score_thresholds"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_nutri_score_thresholds_nutrient", "nutrient"),)
 
-    ingredients: Optional[List[str]] = Field(default=None)
-    allergens: Optional[List[str]] = Field(default=None)
-    categories: Optional[List[str]] = Field(default=None)
+    profile_id: int = Field(foreign_key="nutrition_profiles.id", primary_key=True)
+    score: NutriScore = Field(
+        sa_column=Column(NutriScoreInt, primary_key=True), description="Nutri-score this threshold applies to"
+    )
+    nutrient: str = Field(primary_key=True, max_length=32, description="Nutrient name (e.g. 'sugars')")
+    min_val: Optional[float] = Field(default=None, sa_column=nutrient_column())
+    max_val: Optional[float] = Field(default=None, sa_column=nutrient_column())
 
+    # Relationships
+    profile: NutritionProfile = Relationship(back_populates="nutri_score_thresholds")
 
-class FoodItemUpdate(SQLModel, table=False):
-    """Schema for updating a food item"""
 
-    name: Optional[str] = Field(default=None, max_length=255)
-    brand: Optional[str] = Field(default=None, max_length=255)
-    description: Optional[str] = Field(default=None, max_length=1000)
+# Non-persistent schemas (for validation, forms, API requests/responses)
+class FoodItemCreate(_FoodItemNutritionBase, table=False):
+    """Schema for creating a new food item"""
 
-    # Nutritional information
-    energy_kj: Optional[Decimal] = Field(default=None)
-    energy_kcal: Optional[Decimal] = Field(default=None)
-    fat: Optional[Decimal] = Field(default=None)
-    saturated_fat: Optional[Decimal] = Field(default=None)
-    carbohydrates: Optional[Decimal] = Field(default=None)
-    sugars: Optional[Decimal] = Field(default=None)
-    fiber: Optional[Decimal] = Field(default=None)
-    protein: Optional[Decimal] = Field(default=None)
-    salt: Optional[Decimal] = Field(default=None)
-    sodium: Optional[Decimal] = Field(default=None)
 
-    nutri_score: Optional[NutriScore] = Field(default=None)
-    health_assessment: Optional[HealthAssessment] = Field(default=None)
+class FoodItemUpdate(_FoodItemNutritionBase, table=False):
+    """Schema for updating a food item (all fields optional)"""
 
-    ingredients: Optional[List[str]] = Field(default=None)
-    allergens: Optional[List[str]] = Field(default=None)
-    categories: Optional[List[str]] = Field(default=None)
+    name: Optional[str] = Field(default=None, max_length=255)  # type: ignore[assignment]
 
 
 class BarcodeCreate(SQLModel, table=False):
     """Schema for creating a new barcode"""
 
     code: str = Field(max_length=50)
-    barcode_type: str = Field(max_length=20)
+    barcode_type: BarcodeType
     food_item_id: int
 
 
+# Immutable per-request DTOs: frozen + no extras lets pydantic-core take
+# fast paths and keeps per-instance allocations down.
+_DTO_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
+
 class ScanResult(SQLModel, table=False):
     """Schema for barcode scan results"""
 
+    model_config = _DTO_CONFIG  # type: ignore[assignment]
+
     barcode: str = Field(description="Scanned barcode")
     found: bool = Field(description="Whether the barcode was found in database")
     food_item: Optional[Dict[str, Any]] = Field(default=None, description="Food item details if found")
     nutri_score: Optional[NutriScore] = Field(default=None)
     health_assessment: Optional[HealthAssessment] = Field(default=None)
-    scan_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    scan_timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def from_food_item(cls, food_item: FoodItem, barcode: str, found: bool = True) -> "ScanResult":
+        """Build a scan result from a DB row without re-running validation.
+
+        Uses model_construct() because the database already enforces the
+        constraints — must not be used on user-supplied payloads.
+        """
+        return cls.model_construct(
+            barcode=barcode,
+            found=found,
+            food_item=food_item.model_dump(exclude={"barcodes", "scan_history", "response_cache_json"}),
+            nutri_score=food_item.nutri_score,
+            health_assessment=food_item.health_assessment,
+            scan_timestamp=datetime.now(timezone.utc),
+        )
+
+    def to_orjson(self) -> bytes:
+        """Serialize to JSON bytes with orjson, for writing straight into an HTTP response."""
+        from app.serialization import orjson_dumps
+
+        return orjson_dumps(self.model_dump(mode="python"))
 
 
 class NutritionSummary(SQLModel, table=False):
     """Schema for nutrition information display"""
 
-    energy_kcal: Optional[Decimal] = Field(default=None)
-    fat: Optional[Decimal] = Field(default=None)
-    saturated_fat: Optional[Decimal] = Field(default=None)
-    carbohydrates: Optional[Decimal] = Field(default=None)
-    sugars: Optional[Decimal] = Field(default=None)
-    fiber: Optional[Decimal] = Field(default=None)
-    protein: Optional[Decimal] = Field(default=None)
-    salt: Optional[Decimal] = Field(default=None)
+    model_config = _DTO_CONFIG  # type: ignore[assignment]
+
+    energy_kcal: Optional[float] = Field(default=None)
+    fat: Optional[float] = Field(default=None)
+    saturated_fat: Optional[float] = Field(default=None)
+    carbohydrates: Optional[float] = Field(default=None)
+    sugars: Optional[float] = Field(default=None)
+    fiber: Optional[float] = Field(default=None)
+    protein: Optional[float] = Field(default=None)
+    salt: Optional[float] = Field(default=None)
+
+    @classmethod
+    def from_food_item(cls, food_item: FoodItem) -> "NutritionSummary":
+        """Build a summary from a DB row without re-running validation.
+
+        Uses model_construct() because the database already enforces the
+        constraints — must not be used on user-supplied payloads.
+        """
+        return cls.model_construct(
+            energy_kcal=food_item.energy_kcal,
+            fat=food_item.fat,
+            saturated_fat=food_item.saturated_fat,
+            carbohydrates=food_item.carbohydrates,
+            sugars=food_item.sugars,
+            fiber=food_item.fiber,
+            protein=food_item.protein,
+            salt=food_item.salt,
+        )
+
+
+class FoodItemCard(SQLModel, table=False):
+    """Lightweight FoodItem projection for list views (no nutrition columns or array blobs).
+
+    Built from column-projected queries — see app.queries.
+    """
+
+    model_config = _DTO_CONFIG  # type: ignore[assignment]
+
+    id: int
+    name: str
+    brand: Optional[str] = Field(default=None)
+    nutri_score: Optional[NutriScore] = Field(default=None)
 
 
 class HealthScore(SQLModel, table=False):
     """Schema for health scoring calculation"""
 
+    model_config = _DTO_CONFIG  # type: ignore[assignment]
+
     nutri_score: NutriScore
     health_assessment: HealthAssessment
     score_factors: Dict[str, Any] = Field(description="Factors contributing to the score")
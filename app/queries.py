@@ -0,0 +1,33 @@
+"""Column-projected loaders for FoodItem list views.
+
+Full ORM hydration of FoodItem fetches and parses every nutrient and
+array column per row; list views only need id/name/brand/nutri_score.
+These loaders select just those columns and skip validation on the way
+out, cutting bytes fetched and allocated several-fold.
+"""
+
+from typing import Iterator, List, Optional, Sequence
+
+from sqlmodel import Session, col, select
+
+from app.models import FoodItem, FoodItemCard
+
+_CARD_COLUMNS = (col(FoodItem.id), col(FoodItem.name), col(FoodItem.brand), col(FoodItem.nutri_score))
+
+
+def load_food_item_cards(session: Session, ids: Optional[Sequence[int]] = None) -> List[FoodItemCard]:
+    """Load card projections, optionally restricted to the given ids."""
+    stmt = select(*_CARD_COLUMNS)
+    if ids is not None:
+        stmt = stmt.where(col(FoodItem.id).in_(ids))
+    return [
+        FoodItemCard.model_construct(id=row[0], name=row[1], brand=row[2], nutri_score=row[3])
+        for row in session.exec(stmt).all()
+    ]
+
+
+def iter_food_item_cards(session: Session, batch_size: int = 500) -> Iterator[FoodItemCard]:
+    """Stream card projections in server-side batches without materializing the whole result set."""
+    stmt = select(*_CARD_COLUMNS).execution_options(yield_per=batch_size)
+    for row in session.exec(stmt):
+        yield FoodItemCard.model_construct(id=row[0], name=row[1], brand=row[2], nutri_score=row[3])
@@ -0,0 +1,71 @@
+"""Buffered recording of barcode scans.
+
+Creating a ScanHistory instance per scan pays Pydantic validation and
+ORM unit-of-work tracking per row. Under bursts, scans are appended to
+an in-memory buffer instead and flushed in one bulk_insert_mappings
+call, which skips instance construction and change tracking entirely.
+"""
+
+import asyncio
+from logging import getLogger
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from app.database import get_session
+from app.models import HealthAssessment, NutriScore, ScanHistory
+
+logger = getLogger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 1.0
+
+_SCAN_BUFFER: List[Dict[str, Any]] = []
+_BUFFER_LOCK = Lock()
+
+
+def enqueue_scan(
+    barcode: str,
+    food_item_id: int,
+    user_agent: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    nutri_score: Optional[NutriScore] = None,
+    health_assessment: Optional[HealthAssessment] = None,
+) -> None:
+    """Queue one scan for the next bulk flush (scan_timestamp is assigned by the database)."""
+    row = {
+        "food_item_id": food_item_id,
+        "barcode_scanned": barcode,
+        "user_agent": user_agent,
+        "ip_address": ip_address,
+        "nutri_score_at_scan": nutri_score,
+        "health_assessment_at_scan": health_assessment,
+    }
+    with _BUFFER_LOCK:
+        _SCAN_BUFFER.append(row)
+
+
+def flush_scans() -> int:
+    """Write all buffered scans in a single bulk insert. Returns the number of rows flushed."""
+    with _BUFFER_LOCK:
+        if not _SCAN_BUFFER:
+            return 0
+        batch = _SCAN_BUFFER.copy()
+        _SCAN_BUFFER.clear()
+    with get_session() as session:
+        session.bulk_insert_mappings(ScanHistory, batch)  # type: ignore[arg-type]
+        session.commit()
+    return len(batch)
+
+
+async def flush_scans_periodically() -> None:
+    """Background loop flushing the scan buffer every FLUSH_INTERVAL_SECONDS.
+
+    Start with asyncio.create_task() from application startup.
+    """
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        try:
+            # blocking DB I/O goes to a worker thread so the (single) event
+            # loop serving the UI never stalls on a slow flush
+            await asyncio.to_thread(flush_scans)
+        except Exception:
+            logger.exception("Failed to flush scan buffer")
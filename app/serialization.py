@@ -0,0 +1,41 @@
+"""orjson-backed response serialization for API endpoints.
+
+Returning Pydantic models from FastAPI goes through jsonable_encoder,
+re-validation and stdlib json.dumps — the dominant cost of JSON APIs.
+Endpoints should serialize with orjson instead:
+
+    return ORJSONResponse(result.model_dump())
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, skipping jsonable_encoder and stdlib json.dumps."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
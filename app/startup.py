@@ -1,10 +1,24 @@
+import asyncio
+from logging import getLogger
+
 from app.database import create_tables
+from app.scan_buffer import flush_scans_periodically
+from app.thresholds import load_thresholds
 from nicegui import ui
 
+logger = getLogger(__name__)
+
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    load_thresholds()
+
+    try:
+        asyncio.get_running_loop().create_task(flush_scans_periodically())
+    except RuntimeError:
+        # no running loop (e.g. tests calling startup() directly); flush_scans() can still be called manually
+        logger.warning("No running event loop; scan buffer flush loop not started")
 
     @ui.page("/")
     def index():
@@ -0,0 +1,38 @@
+"""In-process cache of Nutri-score thresholds.
+
+Thresholds change rarely but are consulted on every health-score
+computation, so they are loaded from nutri_score_thresholds once at
+process start and served from a plain dict afterwards.
+"""
+
+from logging import getLogger
+from typing import Dict, Optional, Tuple
+
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import NutriScore, NutriScoreThreshold
+
+logger = getLogger(__name__)
+
+# (profile_id, score letter, nutrient) -> (min_val, max_val)
+ThresholdKey = Tuple[int, str, str]
+ThresholdRange = Tuple[Optional[float], Optional[float]]
+
+_THRESHOLDS: Dict[ThresholdKey, ThresholdRange] = {}
+
+
+def load_thresholds() -> int:
+    """Populate the cache from the database. Call at startup; returns the number of rows loaded."""
+    with get_session() as session:
+        rows = session.exec(select(NutriScoreThreshold)).all()
+    _THRESHOLDS.clear()
+    for row in rows:
+        _THRESHOLDS[(row.profile_id, NutriScore(row.score).label, row.nutrient)] = (row.min_val, row.max_val)
+    logger.info(f"Loaded {len(_THRESHOLDS)} nutri-score thresholds")
+    return len(_THRESHOLDS)
+
+
+def get_threshold(profile_id: int, score: str, nutrient: str) -> Optional[ThresholdRange]:
+    """Look up a (min_val, max_val) range from the cache."""
+    return _THRESHOLDS.get((profile_id, score, nutrient))
@@ -0,0 +1,161 @@
+"""Logic-focused unit tests for the model layer and service modules.
+
+Runs against an in-memory SQLite engine (the list/score columns declare
+SQLite variants for exactly this), so no PostgreSQL is needed.
+"""
+
+import orjson
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+import app.database as database
+from app import cache, models, queries, scan_buffer, thresholds
+
+
+@pytest.fixture()
+def engine(monkeypatch):
+    """In-memory SQLite engine wired into app.database for the duration of a test."""
+    test_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(test_engine)
+    monkeypatch.setattr(database, "ENGINE", test_engine)
+    cache.invalidate_scan_cache()
+    scan_buffer._SCAN_BUFFER.clear()
+    yield test_engine
+    cache.invalidate_scan_cache()
+    scan_buffer._SCAN_BUFFER.clear()
+
+
+@pytest.fixture()
+def cola_barcode(engine):
+    """A FoodItem with one barcode; returns (food_item_id, code)."""
+    with Session(engine) as session:
+        item = models.FoodItem(name="Cola", sodium=0.4, nutri_score=models.NutriScore.E)
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+        assert item.id is not None
+        session.add(models.Barcode(code="5449000000996", barcode_type=models.BarcodeType.EAN13, food_item_id=item.id))
+        session.commit()
+        return item.id, "5449000000996"
+
+
+# --- pure model logic ---
+
+
+def test_salt_computed_from_sodium():
+    item = models.FoodItem(name="x", sodium=0.4)
+    assert item.salt == 1.0
+    assert item.model_dump()["salt"] == 1.0
+
+
+def test_salt_is_none_without_sodium():
+    assert models.FoodItem(name="x").salt is None
+
+
+def test_barcode_type_string_round_trip():
+    assert models.BarcodeType.from_str("UPC-A") is models.BarcodeType.UPC_A
+    assert models.BarcodeType.UPC_A.to_str() == "UPC-A"
+    assert models.BarcodeType.from_str("ean13") is models.BarcodeType.EAN13
+    with pytest.raises(KeyError):
+        models.BarcodeType.from_str("QR")
+
+
+def test_nutri_score_label_and_lookup():
+    assert models.NutriScore.A.label == "A"
+    assert models.nutri_from_str("B") is models.NutriScore.B
+    assert models.NutriScore.A < models.NutriScore.E
+    assert models.health_from_str("Moderate") is models.HealthAssessment.MODERATE
+
+
+def test_refresh_response_cache_requires_flushed_row():
+    item = models.FoodItem(name="x")
+    with pytest.raises(ValueError):
+        item.refresh_response_cache()
+
+
+# --- barcode payload cache ---
+
+
+def test_scan_cache_hit_serves_same_bytes(cola_barcode):
+    _, code = cola_barcode
+    first = cache.scan_payload_for_barcode(code)
+    assert first is not None
+    assert first is cache.scan_payload_for_barcode(code)
+    payload = orjson.loads(first)
+    assert payload["found"] is True
+    assert payload["food_item"]["name"] == "Cola"
+    assert payload["nutri_score"] == int(models.NutriScore.E)
+
+
+def test_scan_cache_miss_for_unknown_code(engine):
+    assert cache.scan_payload_for_barcode("0000000000000") is None
+
+
+def test_scan_cache_invalidation_picks_up_new_items(engine):
+    assert cache.scan_payload_for_barcode("123") is None
+    with Session(engine) as session:
+        item = models.FoodItem(name="Bread")
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+        assert item.id is not None
+        session.add(models.Barcode(code="123", barcode_type=models.BarcodeType.EAN8, food_item_id=item.id))
+        session.commit()
+    # stale miss until invalidated
+    assert cache.scan_payload_for_barcode("123") is None
+    cache.invalidate_scan_cache()
+    assert cache.scan_payload_for_barcode("123") is not None
+
+
+# --- scan write buffer ---
+
+
+def test_flush_scans_drains_buffer(cola_barcode):
+    food_item_id, code = cola_barcode
+    scan_buffer.enqueue_scan(code, food_item_id, nutri_score=models.NutriScore.E)
+    scan_buffer.enqueue_scan(code, food_item_id)
+    assert scan_buffer.flush_scans() == 2
+    assert scan_buffer.flush_scans() == 0
+    with Session(database.ENGINE) as session:
+        rows = session.exec(select(models.ScanHistory)).unique().all()
+    assert len(rows) == 2
+    assert all(row.scan_timestamp is not None for row in rows)
+    assert rows[0].nutri_score_at_scan is models.NutriScore.E
+
+
+# --- nutri-score threshold cache ---
+
+
+def test_threshold_cache_lookup(engine):
+    with Session(engine) as session:
+        profile = models.NutritionProfile(name="General Adult")
+        session.add(profile)
+        session.commit()
+        session.refresh(profile)
+        assert profile.id is not None
+        session.add(
+            models.NutriScoreThreshold(profile_id=profile.id, score=models.NutriScore.A, nutrient="sugars", max_val=4.5)
+        )
+        session.commit()
+        profile_id = profile.id
+    assert thresholds.load_thresholds() == 1
+    assert thresholds.get_threshold(profile_id, "A", "sugars") == (None, 4.5)
+    assert thresholds.get_threshold(profile_id, "B", "sugars") is None
+
+
+# --- column-projected list loaders ---
+
+
+def test_load_food_item_cards_projection(engine):
+    with Session(engine) as session:
+        for i in range(3):
+            session.add(models.FoodItem(name=f"item{i}", brand="b", nutri_score=models.NutriScore.A))
+        session.commit()
+        cards = queries.load_food_item_cards(session)
+        assert {card.name for card in cards} == {"item0", "item1", "item2"}
+        assert cards[0].nutri_score is models.NutriScore.A
+        subset = queries.load_food_item_cards(session, ids=[cards[0].id])
+        assert len(subset) == 1
+        streamed = list(queries.iter_food_item_cards(session, batch_size=2))
+        assert len(streamed) == 3